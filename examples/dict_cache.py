@@ -0,0 +1,83 @@
+# Building the example dictionaries takes a moment, and Plover does that on
+# every start, so they're pickled after being built once. Every cache is keyed
+# by the sources it's built from (and Plovary itself), so it's rebuilt whenever
+# any of them changes.
+#
+# `plovary.system` is pickled by name, so cached dictionaries of it (like
+# ezkana's) work together with everything else using it. Any other system
+# (like plovim's) comes back as its own copy though, so chords for a cached
+# dictionary of one have to be made with the `.system` of its chords.
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from typing import *
+
+import plovary
+
+T = TypeVar("T")
+
+
+class SystemPickler(pickle.Pickler):
+    def persistent_id(self, obj: Any) -> Optional[str]:
+        return "system" if obj is plovary.system else None
+
+
+class SystemUnpickler(pickle.Unpickler):
+    def persistent_load(self, pid: Any) -> Any:
+        if pid == "system":
+            return plovary.system
+        raise pickle.UnpicklingError(f"Unknown persistent id {pid!r}")
+
+
+def cache_file(name: str, sources: List[str]) -> str:
+    digest = hashlib.sha1(sys.version.encode())
+    for source in sources + [plovary.__file__]:
+        with open(source, "rb") as f:
+            digest.update(f.read())
+
+    # An empty `XDG_CACHE_HOME` counts as unset
+    cache_dir = (
+        os.environ.get("XDG_CACHE_HOME") or
+        os.path.join(os.path.expanduser("~"), ".cache")
+    )
+    return os.path.join(cache_dir, name, digest.hexdigest()[:16] + ".pkl")
+
+
+def cached(name: str, sources: List[str], build: Callable[[], T]) -> T:
+    """
+    Loads what `build` returned the last time it was called with the same
+    `sources`, or calls it and stores the result for next time
+    """
+
+    cache = cache_file(name, sources)
+
+    # A broken cache file can fail to load in all sorts of ways, and it would
+    # stay broken until the sources change, so it's just built again instead
+    try:
+        with open(cache, "rb") as f:
+            return cast(T, SystemUnpickler(f).load())
+    except Exception:
+        pass
+
+    out = build()
+
+    # Not being able to write the cache just means it's built again next time
+    try:
+        os.makedirs(os.path.dirname(cache), exist_ok=True)
+        # Several dictionaries sharing a cache can be built at the same time
+        # (like both ezkana ones), so each writes to its own temporary file
+        fd, temp = tempfile.mkstemp(dir=os.path.dirname(cache), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                SystemPickler(f).dump(out)
+            os.replace(temp, cache)
+        finally:
+            if os.path.exists(temp):
+                os.remove(temp)
+    except OSError:
+        pass
+
+    return out
@@ -2,6 +2,6 @@ import os, sys
 path = os.path.dirname(os.path.abspath(__file__))
 if path not in sys.path: sys.path.append(path)
 
-from ezkana import final_proper
+from ezkana_cache import final_dicts
 
-final_proper.plover_dict_main(__name__, globals())
+final_dicts()["proper"].plover_dict_main(__name__, globals())
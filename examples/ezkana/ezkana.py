@@ -1,6 +1,8 @@
 from typing import *
 from plovary import *
+from itertools import chain
 import os
+import re
 
 # "English Single Chord DICTionary"
 ESCDict = Dictionary[Chord[EnglishSystem], str]
@@ -30,9 +32,16 @@ n = Dictionary({add_n: "nn"})
 # this, because I have yet to figure out how to give `ibus`
 # katakana explicitly)
 katakana_elongate = system.parsed_single_dict({"AOEU": "--"})
+starred_katakana_elongate = katakana_elongate.map(keys=add("*"))
+
+# `keys_for` has to go through the whole dictionary, so the chord for every
+# letter is looked up once here instead
+letter_chords: Dict[str, Chord[EnglishSystem]] = {}
+for k, v in fingertyping_lowercase_no_asterisk:
+    letter_chords.setdefault(v, k)
 
 normal_consonants = Dictionary(
-    (fingertyping_lowercase_no_asterisk.keys_for(k)[0], k)
+    (letter_chords[k], k)
     for k in [
         "k", "g",
         "s", "z",
@@ -59,7 +68,7 @@ special_consonants = system.parsed_single_dict({
 })
 
 vowels = Dictionary(
-    (fingertyping_lowercase_no_asterisk.keys_for(k)[0], k)
+    (letter_chords[k], k)
     for k in ["a", "i", "u", "e", "o"]
 ) + system.parsed_single_dict({
     "AE": "a a",
@@ -69,144 +78,182 @@ vowels = Dictionary(
     "OU": "o u",
 })
 
-simple_consonants = normal_consonants + no_consonant + y_consonants
+simple_consonants = Dictionary.union(
+    normal_consonants,
+    no_consonant,
+    y_consonants,
+)
 
 simple_combinations = simple_consonants * vowels
 
-special_combinations = special_consonants.combinations(
-    vowels,
-    values=lambda cv, v: (
-        cv + v[1:]
-        if cv.endswith(v[0])
-        else cv + "l" + v
-    ),
+special_combinations = Dictionary(
+    (
+        k_cv + k_v,
+        cv + v[1:] if cv.endswith(v[0]) else cv + "l" + v,
+    )
+    for k_cv, cv in special_consonants
+    for k_v, v in vowels
 )
 
 combinations = simple_combinations + special_combinations
 
-extended_combinations = (
-    (small_tu.with_empty_chord() * combinations + small_tu) *
-    n.with_empty_chord() +
-    n
-)
+def build_extended_combinations() -> ESCDict:
+    """
+    The same as
+    `(small_tu.with_empty_chord() * combinations + small_tu) *
+    n.with_empty_chord() + n`, but without building all of the dictionaries
+    in between
+    """
+
+    small_tu_or_nothing = list(small_tu.with_empty_chord())
+    n_or_nothing = list(n.with_empty_chord())
+
+    with_small_tu = chain(
+        (
+            (k_tu + k, v_tu + v)
+            for k_tu, v_tu in small_tu_or_nothing
+            for k, v in combinations
+        ),
+        small_tu,
+    )
+
+    return Dictionary(chain(
+        (
+            (k + k_n, v + v_n)
+            for k, v in with_small_tu
+            for k_n, v_n in n_or_nothing
+        ),
+        n,
+    ))
+
+extended_combinations = build_extended_combinations()
 
 katakana_combinations = extended_combinations + katakana_elongate
 
+# Everything that gets translated is made up of symbols with two characters
+assert all(len(i) % 2 == 0 for i in katakana_combinations.values())
+
+# Splits an output into its symbols
+symbol_pattern = re.compile("..", re.DOTALL)
+
 def translate(
     dictionary: ESCDict,
     symbol_mapping: Callable[[str], str]
 ) -> ESCDict:
     def value_mapping(output: str) -> str:
-        assert len(output) % 2 == 0
-
-        return "".join(
-            symbol_mapping(output[i:i+2])
-            for i in range(0, len(output), 2)
-        )
+        return "".join(map(symbol_mapping, symbol_pattern.findall(output)))
 
     return dictionary.map(values=value_mapping)
 
-def handle_ime() -> ESCDict:
-    def translate_symbol(symbol: str) -> str:
-        symbol = (
-            "ltu"
-            if symbol == "xu"
+vowel_order = {
+    "a": 0,
+    "i": 1,
+    "u": 2,
+    "e": 3,
+    "o": 4,
+}
+
+hiragana = {
+    " ": "あいうえお",
+    "k": "かきくけこ",
+    "g": "がぎぐげご",
+    "s": "さしすせそ",
+    "z": "ざじずぜぞ",
+    "t": "たちつてと",
+    "d": "だぢづでど",
+    "n": "なにぬねの",
+    "h": "はひふへほ",
+    "b": "ばびぶべぼ",
+    "p": "ぱぴぷぺぽ",
+    "m": "まみむめも",
+    "y": "や ゆ よ",
+    "r": "らりるれろ",
+    "w": "わゐ ゑを",
+    "l": "ゃぃゅぇょ",
+    "nn": "ん",
+    "xu": "っ",
+}
+
+katakana = {
+    " ": "アイウエオ",
+    "k": "カキクケコ",
+    "g": "ガギグゲゴ",
+    "s": "サシスセソ",
+    "z": "ザジズゼゾ",
+    "t": "タチツテト",
+    "d": "ダヂヅデド",
+    "n": "ナニヌネノ",
+    "h": "ハヒフヘホ",
+    "b": "バビブベボ",
+    "p": "パピプペポ",
+    "m": "マミムメモ",
+    "y": "ヤ ユ ヨ",
+    "r": "ラリルレロ",
+    "w": "ワヰ ヱヲ",
+    "l": "ャィュェョ",
+    "nn": "ン",
+    "xu": "ッ",
+}
+
+def flatten(table: Dict[str, str]) -> Dict[str, str]:
+    """
+    Turns a table like the ones above into one that directly maps every
+    symbol, so translating a symbol is a single lookup
+    """
+
+    out = {"--": "ー"}
+    for k, v in table.items():
+        if len(v) == 1:
+            out[k] = v
+        else:
+            for vowel, idx in vowel_order.items():
+                out[k + vowel] = v[idx]
+    return out
+
+hiragana_flat = flatten(hiragana)
+katakana_flat = flatten(katakana)
+
+def translate_ime_symbol(symbol: str) -> str:
+    symbol = (
+        "ltu"
+        if symbol == "xu"
+        else (
+            "-"
+            if symbol == "--"
             else (
-                "-"
-                if symbol == "--"
-                else (
-                    "ly" + symbol[1]
-                    if symbol in ["la", "lu", "lo"]
-                    else symbol.replace(" ", "")
-                )
+                "ly" + symbol[1]
+                if symbol in ["la", "lu", "lo"]
+                else symbol.replace(" ", "")
             )
         )
+    )
 
-        if len(symbol) == 1:
-            return symbol
-        else:
-            return (
-                symbol[0] +
-                "{^}{#" + " ".join(symbol[1:]) + "}{^}"
-            )
+    if len(symbol) == 1:
+        return symbol
+    else:
+        return (
+            symbol[0] +
+            "{^}{#" + " ".join(symbol[1:]) + "}{^}"
+        )
+
+# There are only a handful of different symbols (the same ones as for the
+# proper tables), but thousands of outputs made up of them, so all of them are
+# translated up front
+ime_flat = {i: translate_ime_symbol(i) for i in hiragana_flat}
 
+def handle_ime() -> ESCDict:
     # We don't put anything on the asterisk except the
     # elongating thingy for katakana
     return translate(
-        extended_combinations + katakana_elongate.map(keys=add("*")),
-        translate_symbol,
+        extended_combinations + starred_katakana_elongate,
+        ime_flat.__getitem__,
     ) * system.toggle(submit, "a{^}{#Backspace}{^ ^}")
 
 def handle_proper() -> ESCDict:
-    vowel_order = {
-        "a": 0,
-        "i": 1,
-        "u": 2,
-        "e": 3,
-        "o": 4,
-    }
-
-    hiragana = {
-        " ": "あいうえお",
-        "k": "かきくけこ",
-        "g": "がぎぐげご",
-        "s": "さしすせそ",
-        "z": "ざじずぜぞ",
-        "t": "たちつてと",
-        "d": "だぢづでど",
-        "n": "なにぬねの",
-        "h": "はひふへほ",
-        "b": "ばびぶべぼ",
-        "p": "ぱぴぷぺぽ",
-        "m": "まみむめも",
-        "y": "や ゆ よ",
-        "r": "らりるれろ",
-        "w": "わゐ ゑを",
-        "l": "ゃぃゅぇょ",
-        "nn": "ん",
-        "xu": "っ",
-    }
-
-    katakana = {
-        " ": "アイウエオ",
-        "k": "カキクケコ",
-        "g": "ガギグゲゴ",
-        "s": "サシスセソ",
-        "z": "ザジズゼゾ",
-        "t": "タチツテト",
-        "d": "ダヂヅデド",
-        "n": "ナニヌネノ",
-        "h": "ハヒフヘホ",
-        "b": "バビブベボ",
-        "p": "パピプペポ",
-        "m": "マミムメモ",
-        "y": "ヤ ユ ヨ",
-        "r": "ラリルレロ",
-        "w": "ワヰ ヱヲ",
-        "l": "ャィュェョ",
-        "nn": "ン",
-        "xu": "ッ",
-    }
-
-    def translation_for(
-        table: Dict[str, str]
-    ) -> Callable[[str], str]:
-        def translate_symbol(symbol: str) -> str:
-            if symbol == "--":
-                return "ー"
-            elif symbol in table:
-                return table[symbol]
-            else:
-                return table[symbol[0]][vowel_order[symbol[1]]]
-
-        return translate_symbol
-
     return (
-        translate(extended_combinations, translation_for(hiragana)) +
-        translate(
-            extended_combinations + katakana_elongate,
-            translation_for(katakana),
-        ).map(keys=add("*"))
+        translate(extended_combinations, hiragana_flat.__getitem__) +
+        translate(katakana_combinations, katakana_flat.__getitem__)
+            .map(keys=add("*"))
     ) * system.toggle(submit, "")  # Make submit do nothing here
 
 def finalize(dictionary: ESCDict) -> ESCDict:
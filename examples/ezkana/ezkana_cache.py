@@ -0,0 +1,24 @@
+# Caches the dictionaries built by `ezkana.py` (see `../dict_cache.py`)
+
+import os
+import sys
+from typing import *
+
+from plovary import Chord, Dictionary, EnglishSystem
+
+path = os.path.dirname(os.path.abspath(__file__))
+for i in [path, os.path.dirname(path)]:
+    if i not in sys.path: sys.path.append(i)
+
+from dict_cache import cached
+
+ESCDict = Dictionary[Chord[EnglishSystem], str]
+
+
+def build() -> Dict[str, ESCDict]:
+    from ezkana import final_ime, final_proper
+    return {"ime": final_ime, "proper": final_proper}
+
+
+def final_dicts() -> Dict[str, ESCDict]:
+    return cached("ezkana", [os.path.join(path, "ezkana.py")], build)
@@ -0,0 +1,9 @@
+# The same as `plovim.py`, but only rebuilds the dictionary if `plovim.py` (or
+# anything it's built from) has changed since the last time
+import os, sys
+path = os.path.dirname(os.path.abspath(__file__))
+if path not in sys.path: sys.path.append(path)
+
+from plovim_cache import final_dict
+
+final_dict().plover_dict_main(__name__, globals())
@@ -284,10 +284,10 @@ with_character = system.parsed_single_dict({
     "-x↓": "gr",  # replace screen character (down only for disambiguation)
 })
 
-characters = (
-    convert_system(fingertyping) +
+characters = Dictionary.union(
+    convert_system(fingertyping),
     convert_system(symbols)
-        .map(keys=sub(system.chord(*symbol_system.always_pressed)))
+        .map(keys=sub(system.chord(*symbol_system.always_pressed))),
 )
 
 # These cannot take numbers
@@ -436,7 +436,11 @@ other_commands = system.parsed_single_dict({
     "STKPWHR": insert(0, ""),  # exit this dictionary
 })
 
-registers = (
+# 1-9 and 2-9, used by the registers and the numbered versions below
+single_digits = convert_system(single_digit_only) - [system.chord("0")]
+single_digits_without_one = single_digits - [system.chord("1-")]
+
+registers = Dictionary.union(
     # named registers:
     system.parsed_single_dict({
         "-FR": "a",
@@ -446,7 +450,7 @@ registers = (
     }).combinations(
         system.toggle("*", True, default=False),
         values=lambda v, add_to_reg: v.upper() if add_to_reg else v
-    ) +
+    ),
     # special registers except the default one and the removal ones:
     system.parsed_single_dict({
         "AOEU": "0",  # most recent yank
@@ -454,48 +458,66 @@ registers = (
         # For the GUI:
         "-FPLTD": "*",
         "-RBGSZ": "+",
-    }) +
+    }),
     # most recent removals:
-    (convert_system(single_digit_only) - [system.chord("0")])
+    single_digits,
 ).map(keys=add("y"), values=prefix("\""))
 
+no_number = [(system.empty_chord, "")]
+
+# The numbers as they're put in front of commands
+number_prefixes = [(k, v.lstrip("0")) for k, v in single_digits]
+number_prefixes_without_one = [
+    (k, v.lstrip("0"))
+    for k, v in single_digits_without_one
+]
+
 def add_numbered_versions(
     d: Dictionary[Chord[EnglishSystem], Tuple[int, str]],
     *,
     keep_one: bool,
 ) -> Dictionary[Chord[EnglishSystem], str]:
+    numbers = number_prefixes if keep_one else number_prefixes_without_one
+    number_bits = 0
+    for i, _ in numbers:
+        number_bits |= i.bits
+
+    # Only the keys a command shares with the numbers matter here, and lots of
+    # commands share the same ones
+    fixed_numbers: Dict[
+        int,
+        List[Tuple[Chord[EnglishSystem], str]]
+    ] = {}
+
     def fix_overlaps(
-        main_key: Chord[EnglishSystem],
-        numbers: Dictionary[Chord[EnglishSystem], T]
-    ) -> Dictionary[Chord[EnglishSystem], T]:
-        return Dictionary(takewhile(lambda x: not x[0].overlaps(main_key), numbers))
+        main_key: Chord[EnglishSystem]
+    ) -> List[Tuple[Chord[EnglishSystem], str]]:
+        overlap = main_key.bits & number_bits
+        if overlap not in fixed_numbers:
+            fixed_numbers[overlap] = list(
+                takewhile(lambda x: not x[0].bits & overlap, numbers)
+            )
+        return fixed_numbers[overlap]
 
     return Dictionary(
-        (k + k2, number.lstrip("0") + v)
+        (k + k2, number + v)
         for k, (max_digit_count, v) in d
         for digit_count in range(max_digit_count + 1)  # inclusive range
-        for k2, number in {
-            0: Dictionary([(system.empty_chord, "")]),
-            1: fix_overlaps(
-                k,
-                (
-                    convert_system(single_digit_only) - [system.chord("1-")]
-                    if not keep_one else
-                    convert_system(single_digit_only)
-                ) - [system.chord("0")]
-            ),
-        }[digit_count]
+        for k2, number in (no_number if digit_count == 0 else fix_overlaps(k))
     )
 
-combining_right = (
-    add_numbered_versions(motions, keep_one=False) +
-    text_objects
+combining_right = Dictionary.union(
+    add_numbered_versions(motions, keep_one=False),
+    text_objects,
 )
 
 combined = commands_with_motion * combining_right
 
+# All of them have been added at this point
+insert_command_prefixes = tuple(insert_commands_with_motion)
+
 def add_into_insert(value: str) -> str:
-    if any(value.startswith(i) for i in insert_commands_with_motion):
+    if value.startswith(insert_command_prefixes):
         return value + go_into_insert
     else:
         return value
@@ -509,35 +531,39 @@ one_fixes: List[str] = [
     "mpf↑",  # `1]c` and `gu8k` overlap otherwise
 ]
 
-final_dict = (
+final_dict = Dictionary.union(
     (
-        commands_with_motion * combining_right +
-        add_numbered_versions(
+        Dictionary.union(
+            combined,
+            add_numbered_versions(
+                commands_with_motion.map(
+                    keys=add("-l"),
+                    values=lambda x: (1, x + x[-1] if x[0] != "z" else x * 2)
+                ),
+                keep_one=False
+            ),
             commands_with_motion.map(
-                keys=add("-l"),
-                values=lambda x: (1, x + x[-1] if x[0] != "z" else x * 2)
+                keys=add("a(file)"),
+                values=surround("mzgg", "G`z"),
             ),
-            keep_one=False
-        ) +
-        commands_with_motion.map(
-            keys=add("a(file)"),
-            values=surround("mzgg", "G`z"),
         ) -
         [system.parse(i) for i, _ in fixes]
-    ).map(values=add_into_insert) +
-    commands_with_motion * command_motion_kinds.with_empty_chord() +
-    add_numbered_versions(motions, keep_one=True) +
-    text_objects +
-    with_character * characters +
-    with_mark * marks +
+    ).map(values=add_into_insert),
+    commands_with_motion * command_motion_kinds.with_empty_chord(),
+    add_numbered_versions(motions, keep_one=True),
+    text_objects,
+    with_character * characters,
+    with_mark * marks,
     (
         add_numbered_versions(other_commands, keep_one=True) -
-        [system.parse(i) + system.parse("1") for i in one_fixes] -
-        [system.parse("m-l")] +
+        [
+            *(system.parse(i) + system.parse("1") for i in one_fixes),
+            system.parse("m-l"),
+        ] +
         system.parsed_single_dict({"m-l": ":."})
-    ) +
-    registers +
-    convert_system(numbers)
+    ),
+    registers,
+    convert_system(numbers),
 ).map(values=surround("{^}", "{^}"))
 
 final_dict.plover_dict_main(__name__, globals())
@@ -0,0 +1,27 @@
+# Caches the dictionary built by `plovim.py` (see `dict_cache.py`)
+
+import os
+import sys
+from typing import *
+
+from plovary import Chord, Dictionary, EnglishSystem
+
+path = os.path.dirname(os.path.abspath(__file__))
+if path not in sys.path: sys.path.append(path)
+
+from dict_cache import cached
+
+ESCDict = Dictionary[Chord[EnglishSystem], str]
+
+
+def build() -> ESCDict:
+    from plovim import final_dict
+    return final_dict
+
+
+def final_dict() -> ESCDict:
+    return cached(
+        "plovim",
+        [os.path.join(path, "plovim.py"), os.path.join(path, "symbols.py")],
+        build,
+    )
@@ -8,7 +8,8 @@
 import sys
 from typing import *
 from enum import Enum
-from itertools import chain
+from itertools import chain, product
+from weakref import WeakValueDictionary
 
 
 __all__ = [
@@ -55,23 +56,11 @@ def unwrap_optional_or(a: Optional[T], b: T) -> T:
     return a if a is not None else b
 
 
-def sliding_window(
-    iterable: Iterable[T],
-    *,
-    size: int
-) -> Generator[Tuple[T, ...], None, None]:
-    out: Tuple[T, ...] = ()
-    for i in iterable:
-        out += (i,)
-        if len(out) == size:
-            yield out
-            out = out[1:]
-
-
 # `int` for now since the normal `typing` module doesn't provide a type for
 # something that can be compared
 def is_sorted(iterable: Iterable[int]) -> bool:
-    return all(a <= b for a, b in sliding_window(iterable, size=2))
+    items = list(iterable)
+    return all(a <= b for a, b in zip(items, items[1:]))
 
 
 class LayoutBox(NamedTuple):
@@ -112,14 +101,30 @@ class System(object):
     key_order: List[str]  # Includes a hyphen!
     all_keys: List[str]
 
+    # Every real key has its own bit, chords are sets of these (see
+    # `Chord.bits`)
+    key_bits: Dict[str, int]
+    # The position of every real key in `key_order`
+    _real_key_indices: Dict[str, int]
+
     left_keys: List[str]
     left_middle_keys: List[str]
     middle_keys: List[str]
     right_middle_keys: List[str]
     right_keys: List[str]
 
+    # The same as above, just as sets for `Chord`
+    _left_key_set: FrozenSet[str]
+    _left_middle_key_set: FrozenSet[str]
+    _middle_key_set: FrozenSet[str]
+    _right_middle_key_set: FrozenSet[str]
+    _right_key_set: FrozenSet[str]
+    _middle_bits: int
+    _right_bits: int
+
     unordered_keys: List[str]
     combining_keys: List[str]
+    combining_bits: int
 
     layout: Optional[List[LayoutBox]]
     layout_unused: List[str]
@@ -127,6 +132,7 @@ class System(object):
     parse_mandatory_replacements: bool
 
     always_pressed: List[str]
+    always_pressed_bits: int
 
     # Optional replacements are only parsed, not emitted in outputs. This is
     # to allow users to use "pseudo steno" to write out their chords.
@@ -144,6 +150,13 @@ class System(object):
     # Only contains parsed replacements
     combined_replacements: Dict[str, List[str]]
 
+    # `expand_key`, `key_unordered` and `key_index` for every pseudo key
+    _expanded_keys: Dict[str, List[str]]
+    _unordered_pseudo_keys: Dict[str, bool]
+    _key_indices: Dict[str, int]
+    # The bits of every pseudo key (see `key_bits`)
+    _pseudo_key_bits: Dict[str, int]
+
     left_pseudo_keys: List[str]
     left_middle_pseudo_keys: List[str]
     middle_pseudo_keys: List[str]
@@ -151,7 +164,30 @@ class System(object):
     right_pseudo_keys: List[str]
     pseudo_key_order: List[str]
 
+    # For `parse`, depending on whether mandatory replacements are parsed:
+    # what the pseudo keys that may be parsed look like in a chord string and
+    # the real keys they stand for, in the order they're tried on the left
+    # and on the right of the hyphen, as well as the unordered ones (which can
+    # be anywhere in a chord)
+    _parse_tables: Dict[bool, Tuple[
+        List[Tuple[str, List[str]]],
+        List[Tuple[str, List[str]]],
+        List[Tuple[str, List[str]]],
+    ]]
+    # The characters the unordered pseudo keys can start with
+    _unordered_first_chars: FrozenSet[str]
+
+    # For `Chord._to_str`: the position of every pseudo key (and the hyphen)
+    # in its output together with how it's written there, and the emitted
+    # replacements together with their bits
+    _output_forms: Dict[str, Tuple[int, str]]
+    _mandatory_replacement_bits: List[Tuple[str, int]]
+    _overlay_replacement_bits: List[Tuple[str, int]]
+
+    # Every distinct chord only exists once per system (see `Chord.__new__`)
+    _chords: 'WeakValueDictionary[int, Chord[Any]]'
     _empty_chord: 'Chord[Any]'
+    _parse_cache: Dict[Tuple[str, bool, bool], Tuple['Chord[Any]', bool]]
 
     def __init__(self,
         key_order: Optional[List[str]]=None,
@@ -170,6 +206,10 @@ class System(object):
         self.name = unwrap_optional_or(name, self.sys_name)
         self.key_order = unwrap_optional_or(key_order, self.sys_key_order)
         self.all_keys = [i for i in self.key_order if i != "-"]
+        self.key_bits = {k: 1 << i for i, k in enumerate(self.all_keys)}
+        self._real_key_indices = {
+            k: i for i, k in enumerate(self.key_order) if k != "-"
+        }
         self.unordered_keys = (
             unwrap_optional_or(unordered_keys, self.sys_unordered_keys)
         )
@@ -204,6 +244,10 @@ class System(object):
             for i in self.always_pressed
             if i not in self.combining_keys
         ]
+        self.combining_bits = 0
+        for key in self.combining_keys:
+            self.combining_bits |= self.key_bits.get(key, 0)
+        self.always_pressed_bits = self.bits_of_real_keys(self.always_pressed)
 
         all_replacement_dicts = (
             self.optional_replacements,
@@ -228,6 +272,26 @@ class System(object):
                             f"{self.mandatory_replacements!r} overlap"
                         )
 
+        self._expanded_keys = {
+            i: [i] if i in self.key_bits else self.combined_replacements[i]
+            for i in chain(self.all_keys, self.combined_replacements)
+        }
+        self._unordered_pseudo_keys = {
+            k: all(i in self.unordered_keys for i in v)
+            for k, v in self._expanded_keys.items()
+        }
+        self._key_indices = {
+            k: self.real_key_index(
+                next((i for i in v if i not in self.unordered_keys), v[0])
+            )
+            for k, v in self._expanded_keys.items()
+            if v
+        }
+        self._pseudo_key_bits = {
+            k: self.bits_of_real_keys(v)
+            for k, v in self._expanded_keys.items()
+        }
+
         self.left_keys = [i for i in self.all_keys if i.endswith("-")]
         self.right_keys = [i for i in self.all_keys if i.startswith("-")]
         middle_keys_and_hyphen = [
@@ -240,18 +304,30 @@ class System(object):
         self.right_middle_keys = middle_keys_and_hyphen[hyphen_idx + 1:]
         self.middle_keys = self.left_middle_keys + self.right_middle_keys
 
+        self._left_key_set = frozenset(self.left_keys)
+        self._left_middle_key_set = frozenset(self.left_middle_keys)
+        self._middle_key_set = frozenset(self.middle_keys)
+        self._right_middle_key_set = frozenset(self.right_middle_keys)
+        self._right_key_set = frozenset(self.right_keys)
+        self._middle_bits = self.bits_of_real_keys(self.middle_keys)
+        self._right_bits = self.bits_of_real_keys(self.right_keys)
+
         ordered_replacements = [
             i
             for i in self.combined_replacements.keys()
-            if not self.key_unordered(i)
+            if not self._unordered_pseudo_keys[i]
         ]
 
+        # All of these are known pseudo keys, so the checks `key_index` does
+        # aren't needed for sorting them
+        key_indices = self._key_indices
+
         def pseudo_keys_where(
             base: List[str],
             predicate: Callable[[str], bool]
         ) -> List[str]:
             out = base + [i for i in ordered_replacements if predicate(i)]
-            out.sort(key=self.key_index)
+            out.sort(key=key_indices.__getitem__)
             return out
 
         self.left_pseudo_keys = pseudo_keys_where(
@@ -288,16 +364,96 @@ class System(object):
             self.right_pseudo_keys
         )
 
+        unordered_pseudo_keys = self.unordered_keys + [
+            i
+            for i in self.combined_replacements.keys()
+            if self._unordered_pseudo_keys[i]
+        ]
+
+        def parse_table(
+            keys: List[str],
+            parse_mandatory: bool,
+        ) -> List[Tuple[str, List[str]]]:
+            return [
+                (i.replace("-", ""), self._expanded_keys[i])
+                for i in keys
+                if (
+                    parse_mandatory or
+                    i in self.key_bits or
+                    i in self.optional_replacements or
+                    i in self.overlay_replacements
+                )
+            ]
+
+        self._parse_tables = {
+            parse_mandatory: (
+                parse_table(
+                    self.left_pseudo_keys + self.left_middle_pseudo_keys,
+                    parse_mandatory,
+                ),
+                parse_table(
+                    self.right_middle_pseudo_keys + self.right_pseudo_keys,
+                    parse_mandatory,
+                ),
+                parse_table(unordered_pseudo_keys, parse_mandatory),
+            )
+            for parse_mandatory in [False, True]
+        }
+        self._unordered_first_chars = frozenset(
+            i.replace("-", "")[:1] for i in unordered_pseudo_keys
+        )
+
+        self._output_forms = {
+            k: (v, k.replace("-", "")) for k, v in self._key_indices.items()
+        }
+        self._output_forms["-"] = (self.key_order.index("-"), "-")
+        self._mandatory_replacement_bits = [
+            (k, self.bits_of_real_keys(v))
+            for k, v in self.mandatory_replacements.items()
+        ]
+        self._overlay_replacement_bits = [
+            (k, self.bits_of_real_keys(v))
+            for k, v in self.overlay_replacements.items()
+        ]
+
+        self._init_caches()
+
+    def _init_caches(self) -> None:
+        self._chords = WeakValueDictionary()
         self._empty_chord = self.chord()
+        self._parse_cache = {}
+
+    # The caches are full of chords of this system, which can't be unpickled
+    # before the system itself is, so they're rebuilt instead
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        for i in ["_chords", "_empty_chord", "_parse_cache"]:
+            del state[i]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._init_caches()
 
     def assert_real_key(self, *keys: str) -> None:
         for key in keys:
-            if key not in self.all_keys:
+            if key not in self.key_bits:
                 raise ValueError(f"{key!r} is not a key in {self!r}")
 
+    def bits_of_real_keys(self, keys: Iterable[str]) -> int:
+        bits = 0
+        key_bits = self.key_bits
+        try:
+            for key in keys:
+                bits |= key_bits[key]
+        except KeyError as e:
+            self.assert_real_key(e.args[0])
+            raise
+        return bits
+
     def real_key_index(self, key: str) -> int:
         self.assert_real_key(key)
-        return self.key_order.index(key)
+        return self._real_key_indices[key]
 
     def real_keys_ordered(
         self,
@@ -309,9 +465,11 @@ class System(object):
         Being the same key counts as being in order.
         """
         self.assert_real_key(*keys)
+        indices = self._real_key_indices
         if not ignore_unordered:
-            keys = tuple(i for i in keys if i not in self.unordered_keys)
-        return is_sorted(map(self.real_key_index, keys))
+            unordered = self.unordered_keys
+            return is_sorted([indices[i] for i in keys if i not in unordered])
+        return is_sorted([indices[i] for i in keys])
 
     def assert_real_keys_ordered(
         self,
@@ -326,47 +484,61 @@ class System(object):
 
     def assert_key(self, *keys: str) -> None:
         for key in keys:
-            is_real_key = key in self.all_keys 
-            is_pseudo_key = key in self.combined_replacements
-            if not is_real_key and not is_pseudo_key:
+            if key not in self._expanded_keys:
                 raise ValueError(
                     f"{key!r} is not a valid pseudo key in {self!r}"
                 )
 
     def expand_key(self, key: str) -> List[str]:
         self.assert_key(key)
-        if key in self.all_keys:
-            return [key]
-        else:
-            return self.combined_replacements[key]
+        return self._expanded_keys[key]
 
     def key_unordered(self, key: str) -> bool:
-        return all(
-            i in self.unordered_keys
-            for i in self.expand_key(key)
-        )
+        self.assert_key(key)
+        return self._unordered_pseudo_keys[key]
 
     def key_index(self, key: str) -> int:
-        expanded = self.expand_key(key)
-        for i in expanded:
-            if i not in self.unordered_keys:
-                return self.real_key_index(i)
-        return self.real_key_index(expanded[0])
+        self.assert_key(key)
+        return self._key_indices[key]
 
     def keys_ordered(self, *keys: str, ignore_unordered: bool=False) -> bool:
         self.assert_key(*keys)
+        indices = self._key_indices
         if not ignore_unordered:
-            keys = tuple(i for i in keys if not self.key_unordered(i))
-        return is_sorted(map(self.key_index, keys))
+            unordered = self._unordered_pseudo_keys
+            return is_sorted([indices[i] for i in keys if not unordered[i]])
+        return is_sorted([indices[i] for i in keys])
 
     def chord_of_real_keys(
         self: SystemT,
         keys: Iterable[str],
         include_always_pressed: bool=True,
     ) -> 'Chord[SystemT]':
-        return Chord(
-            self,
-            chain(keys, self.always_pressed if include_always_pressed else [])
+        return self.chord_of_bits(
+            self.bits_of_real_keys(keys),
+            include_always_pressed=include_always_pressed,
+        )
+
+    def chord_of_bits(
+        self: SystemT,
+        bits: int,
+        include_always_pressed: bool=True,
+    ) -> 'Chord[SystemT]':
+        if include_always_pressed:
+            bits |= self.always_pressed_bits
+
+        # Most chords built like this already exist, in which case the keys
+        # don't have to be gone through at all
+        chord = cast('Optional[Chord[SystemT]]', self._chords.get(bits))
+        if chord is None:
+            chord = Chord._new(self, None, bits)
+        return chord
+
+    def keys_of_bits(self, bits: int) -> FrozenSet[str]:
+        return frozenset(
+            key
+            for i, key in enumerate(self.all_keys)
+            if bits >> i & 1
         )
 
     def chord(
@@ -374,8 +546,16 @@ class System(object):
         *keys: str,
         include_always_pressed: bool=True
     ) -> 'Chord[SystemT]':
-        return self.chord_of_real_keys(
-            chain.from_iterable(self.expand_key(i) for i in keys),
+        bits = 0
+        pseudo_key_bits = self._pseudo_key_bits
+        try:
+            for key in keys:
+                bits |= pseudo_key_bits[key]
+        except KeyError as e:
+            self.assert_key(e.args[0])
+            raise
+        return self.chord_of_bits(
+            bits,
             include_always_pressed=include_always_pressed,
         )
 
@@ -413,76 +593,97 @@ class System(object):
         force_parse_mandatory_replacements: bool=False,
         include_always_pressed: bool=True,
     ) -> 'Chord[SystemT]':
-        left = chord
-        out: List[str] = []
-
-        def try_consume_one(pseudo_key: str) -> bool:
-            nonlocal left
-            nonlocal out
+        # The same chords tend to be parsed over and over again, both while
+        # building dictionaries and when Plover looks strokes up
+        cache_key = (
+            chord,
+            force_parse_mandatory_replacements,
+            include_always_pressed,
+        )
+        if cache_key not in self._parse_cache:
+            self._parse_cache[cache_key] = self._parse_uncached(
+                chord,
+                force_parse_mandatory_replacements=
+                    force_parse_mandatory_replacements,
+                include_always_pressed=include_always_pressed,
+            )
+        parsed, in_steno_order = self._parse_cache[cache_key]
 
-            is_real_key = pseudo_key in self.all_keys
-            is_allowed_pseudo = (
-                pseudo_key in self.optional_replacements or
-                pseudo_key in self.overlay_replacements or
-                self.parse_mandatory_replacements or
-                force_parse_mandatory_replacements
+        if warn_steno_order and not in_steno_order:
+            warn(
+                f"Some pseudo keys might not be in steno order in {chord!r} " +
+                f"in {self!r}"
             )
-            if not is_real_key and not is_allowed_pseudo:
-                return False
 
-            without_hyphen = pseudo_key.replace("-", "")
-            if left.startswith(without_hyphen):
-                left = left[len(without_hyphen):]
-                out += self.expand_key(pseudo_key)
-                return True
-            else:
-                return False
-
-        all_unordered = (
-            self.unordered_keys +
-            [
-                i
-                for i in self.combined_replacements.keys()
-                if self.key_unordered(i)
-            ]
-        )
+        return parsed
+
+    def _parse_uncached(
+        self: SystemT,
+        chord: str,
+        *,
+        force_parse_mandatory_replacements: bool,
+        include_always_pressed: bool,
+    ) -> Tuple['Chord[SystemT]', bool]:
+        """
+        Returns the parsed chord and whether its keys were in steno order
+        """
+
+        # Everything before this has been consumed already
+        position = 0
+        out: List[str] = []
+
+        left_table, right_table, unordered_table = self._parse_tables[
+            self.parse_mandatory_replacements or
+            force_parse_mandatory_replacements
+        ]
+        unordered_first_chars = self._unordered_first_chars
 
         def try_consume_unordered() -> None:
-            while True:
+            nonlocal position
+
+            # Nothing can be consumed if no unordered key starts with the next
+            # character, which is by far the most common case
+            while chord[position:position + 1] in unordered_first_chars:
                 done = True
-                for i in all_unordered:
-                    if try_consume_one(i):
+                for without_hyphen, expanded in unordered_table:
+                    if chord.startswith(without_hyphen, position):
+                        position += len(without_hyphen)
+                        out.extend(expanded)
                         done = False
                 if done:
                     return
 
-        def try_consume_all(keys: List[str]) -> None:
-            for i in keys:
+        def try_consume_all(table: List[Tuple[str, List[str]]]) -> None:
+            nonlocal position
+
+            for without_hyphen, expanded in table:
                 try_consume_unordered()
-                try_consume_one(i)
+                if chord.startswith(without_hyphen, position):
+                    position += len(without_hyphen)
+                    out.extend(expanded)
 
-        try_consume_all(self.left_pseudo_keys + self.left_middle_pseudo_keys)
+        try_consume_all(left_table)
         try_consume_unordered()
 
-        if left.startswith("-"):
-            left = left[len("-"):]
+        if chord.startswith("-", position):
+            position += len("-")
 
-        try_consume_all(self.right_middle_pseudo_keys + self.right_pseudo_keys)
+        try_consume_all(right_table)
         try_consume_unordered()
 
-        as_set = frozenset(out)
+        bits = self.bits_of_real_keys(out)
 
-        # If this is `True`, the chord wasn't valid. In this case `left` could
-        # already be empty though; for example `F` would be parsed to `-F`,
-        # even though it's not valid due to the missing hyphen - this is what
-        # we detect here.
+        # If this is `True`, the chord wasn't valid. In this case the whole
+        # chord could already be consumed though; for example `F` would be
+        # parsed to `-F`, even though it's not valid due to the missing
+        # hyphen - this is what we detect here.
         hyphen_maybe_missing = (
             "-" not in chord and  # there is no hyphen
-            not as_set & set(self.middle_keys) and  # there are no middle keys
-            as_set & set(self.right_keys)  # but there *are* right keys
+            not bits & self._middle_bits and  # there are no middle keys
+            bits & self._right_bits  # but there *are* right keys
         )
 
-        if hyphen_maybe_missing or left != "":
+        if hyphen_maybe_missing or position != len(chord):
             info = (
                 " (it may be missing a hyphen)" if hyphen_maybe_missing else ""
             )
@@ -490,16 +691,11 @@ class System(object):
                 f"The chord {chord!r} is not valid{info} in {self!r}"
             )
 
-        if warn_steno_order and not self.real_keys_ordered(*out):
-            warn(
-                f"Some pseudo keys might not be in steno order in {chord!r} " +
-                f"in {self!r}"
-            )
-
-        return self.chord_of_real_keys(
-            out,
+        parsed = self.chord_of_bits(
+            bits,
             include_always_pressed=include_always_pressed
         )
+        return (parsed, self.real_keys_ordered(*out))
     
     def parse_many(
         self: SystemT,
@@ -508,7 +704,7 @@ class System(object):
         force_parse_mandatory_replacements: bool=False,
         include_always_pressed: bool=True,
     ) -> Tuple['Chord[SystemT]', ...]:
-        return tuple(
+        return tuple([
             self.parse(
                 i,
                 force_parse_mandatory_replacements=
@@ -516,7 +712,7 @@ class System(object):
                 include_always_pressed=include_always_pressed,
             )
             for i in sequence.split("/")
-        )
+        ])
 
     def parsed_single_dict(
         self: SystemT,
@@ -728,62 +924,125 @@ class System(object):
 
 
 class Chord(Generic[SystemT]):
-    def __init__(self, system: SystemT, keys: Iterable[str]) -> None:
-        self.system: Final[SystemT] = system
-        self.keys: Final[FrozenSet[str]] = frozenset(keys)
-        self.system.assert_real_key(*self.keys)
+    # There are *lots* of chords in a typical dictionary
+    __slots__ = (
+        "system",
+        "bits",
+        "_keys",
+        "_hash",
+        "_plover_str",
+        "_str",
+        "__weakref__",
+    )
+
+    system: SystemT
+    # The keys of this chord as a bit set (see `System.key_bits`), which makes
+    # comparing chords a lot cheaper. `keys` is only built from this when
+    # it's needed.
+    bits: int
+    _keys: Optional[FrozenSet[str]]
+    # Chords are dictionary keys all the time, so this is only computed once
+    _hash: int
+    # Turning dictionaries into Plover dictionaries needs this for every
+    # entry, and the same chords show up in lots of them (the same goes for
+    # `__str__` with reverse lookups and `repr`s)
+    _plover_str: Optional[str]
+    _str: Optional[str]
+
+    def __new__(cls, system: SystemT, keys: Iterable[str]) -> 'Chord[SystemT]':
+        keys = frozenset(keys)
+        bits = system.bits_of_real_keys(keys)
+
+        # Lots of chords are built over and over again (e.g. by `+`), so equal
+        # chords are shared instead of being kept around separately
+        chord = cast('Optional[Chord[SystemT]]', system._chords.get(bits))
+        if chord is None:
+            chord = cls._new(system, keys, bits)
+        return chord
+
+    @classmethod
+    def _new(
+        cls,
+        system: SystemT,
+        keys: Optional[FrozenSet[str]],
+        bits: int,
+    ) -> 'Chord[SystemT]':
+        """
+        Only for chords that don't exist yet, `bits` have to match `keys` (if
+        they're given)
+        """
+        chord = super().__new__(cls)
+        chord.system = system
+        chord.bits = bits
+        chord._keys = keys
+        chord._hash = hash((id(system), bits))
+        chord._plover_str = None
+        chord._str = None
+        system._chords[bits] = chord
+        return chord
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (Chord, (self.system, self.keys))
+
+    @property
+    def keys(self) -> FrozenSet[str]:
+        if self._keys is None:
+            self._keys = self.system.keys_of_bits(self.bits)
+        return self._keys
 
     @property
     def left_keys(self) -> FrozenSet[str]:
-        return self.keys & set(self.system.left_keys)
+        return self.keys & self.system._left_key_set
 
     @property
     def left_middle_keys(self) -> FrozenSet[str]:
-        return self.keys & set(self.system.left_middle_keys)
+        return self.keys & self.system._left_middle_key_set
 
     @property
     def middle_keys(self) -> FrozenSet[str]:
-        return self.keys & set(self.system.middle_keys)
+        return self.keys & self.system._middle_key_set
 
     @property
     def right_middle_keys(self) -> FrozenSet[str]:
-        return self.keys & set(self.system.right_middle_keys)
+        return self.keys & self.system._right_middle_key_set
 
     @property
     def right_keys(self) -> FrozenSet[str]:
-        return self.keys & set(self.system.right_keys)
+        return self.keys & self.system._right_key_set
 
-    def _to_str(self, replacements: Mapping[str, List[str]]={}) -> str:
-        matching_replacements = [
-            (k, v)
-            for k, v in replacements.items()
-            if set(v) <= self.keys
-        ]
+    def _to_str(self, replacements: Sequence[Tuple[str, int]]=()) -> str:
+        """
+        `replacements` are the names of the replacements to emit, together
+        with the bits of the keys they replace
+        """
 
-        outputs = (
-            [k for k, _ in matching_replacements] +
-            [
-                i
-                for i in self.keys
-                if not any(i in j for _, j in matching_replacements)
-            ]
-        )
+        system = self.system
+        forms = system._output_forms
+
+        # Every output goes straight to its position instead of being sorted
+        # there; replacements can share one with each other, so their forms
+        # are appended
+        positions = [""] * len(system.key_order)
+
+        replaced_bits = 0
+        for k, v in replacements:
+            if self.bits & v == v:
+                index, form = forms[k]
+                positions[index] += form
+                replaced_bits |= v
+        for k in system.keys_of_bits(self.bits & ~replaced_bits):
+            index, form = forms[k]
+            positions[index] = form
 
         needs_dash = (
-            (self.keys & set(self.system.right_keys)) and
-            not (self.keys & set(self.system.middle_keys))
+            self.bits & system._right_bits and
+            not self.bits & system._middle_bits
         )
         if needs_dash:
-            outputs.append("-")
-
-        outputs.sort(
-            key=lambda x:
-                self.system.key_index(x)
-                if x != "-"
-                else self.system.key_order.index("-")
-        )
+            index, form = forms["-"]
+            positions[index] = form
 
-        return "".join("-" if i == "-" else i.replace("-", "") for i in outputs)
+        return "".join(positions)
 
     def assert_same_system(self, other: 'Chord[SystemT]') -> None:
         if self.system is not other.system:
@@ -796,11 +1055,11 @@ class Chord(Generic[SystemT]):
 
     def overlaps(self, other: 'Chord[SystemT]') -> bool:
         self.assert_same_system(other)
-        return bool(self.keys & other.keys)
+        return bool(self.bits & other.bits)
 
     def overlaps_noncombining(self, other: 'Chord[SystemT]') -> bool:
         self.assert_same_system(other)
-        return bool(self.keys & other.keys - set(self.system.combining_keys))
+        return bool(self.bits & other.bits & ~self.system.combining_bits)
 
     def assert_no_overlapping_noncombining(
         self,
@@ -811,34 +1070,47 @@ class Chord(Generic[SystemT]):
 
     def is_superset(self, other: 'Chord[SystemT]') -> bool:
         self.assert_same_system(other)
-        return self.keys >= other.keys
+        return self.bits & other.bits == other.bits
 
     def assert_is_superset(self, other: 'Chord[SystemT]') -> None:
         if not self.is_superset(other):
             raise ValueError(f"{self!r} is not a superset of {other!r}")
 
     def mask(self, other: 'Chord[SystemT]') -> 'Chord[SystemT]':
-        return self.system.chord_of_real_keys(self.keys & other.keys)
+        return self.system.chord_of_bits(self.bits & other.bits)
 
     def lax_combine(self, other: 'Chord[SystemT]') -> 'Chord[SystemT]':
         self.assert_same_system(other)
-        return self.system.chord_of_real_keys(self.keys | other.keys)
+        return self.system.chord_of_bits(self.bits | other.bits)
 
     def combine(self, other: 'Chord[SystemT]') -> 'Chord[SystemT]':
-        self.assert_no_overlapping_noncombining(other)
-        return self.lax_combine(other)
+        # This is what `+` does, so the checks are done in one go here
+        system = self.system
+        if (
+            other.system is not system or
+            self.bits & other.bits & ~system.combining_bits
+        ):
+            self.assert_no_overlapping_noncombining(other)
+        return system.chord_of_bits(self.bits | other.bits)
 
     def lax_remove(self, other: 'Chord[SystemT]') -> 'Chord[SystemT]':
         self.assert_same_system(other)
-        return self.system.chord_of_real_keys(self.keys - other.keys)
+        return self.system.chord_of_bits(self.bits & ~other.bits)
 
     def remove(self, other: 'Chord[SystemT]') -> 'Chord[SystemT]':
-        self.assert_is_superset(other)
-        return self.lax_remove(other)
+        # The same as for `combine`, for `-`
+        system = self.system
+        if other.system is not system or self.bits & other.bits != other.bits:
+            self.assert_is_superset(other)
+        return system.chord_of_bits(self.bits & ~other.bits)
 
     @property
     def plover_str(self) -> str:
-        return self._to_str(self.system.mandatory_replacements)
+        if self._plover_str is None:
+            self._plover_str = self._to_str(
+                self.system._mandatory_replacement_bits
+            )
+        return self._plover_str
 
     @property
     def no_replacements_str(self) -> str:
@@ -848,12 +1120,17 @@ class Chord(Generic[SystemT]):
         return f"Chord({self.system!r}, {self})"
 
     def __str__(self) -> str:
-        return self._to_str(self.system.overlay_replacements)
+        if self._str is None:
+            self._str = self._to_str(self.system._overlay_replacement_bits)
+        return self._str
 
     def __contains__(self, item: Union['Chord[SystemT]', str]) -> bool:
         if isinstance(item, str):
             self.system.assert_key(item)
-            return set(self.system.expand_key(item)) <= self.keys
+            item_bits = self.system._pseudo_key_bits[item]
+            return self.bits & item_bits == item_bits
+        elif item.system is self.system:
+            return self.bits & item.bits == item.bits
         else:
             return item.keys <= self.keys
 
@@ -880,11 +1157,14 @@ class Chord(Generic[SystemT]):
             return NotImplemented
 
     def __hash__(self) -> int:
-        return hash((id(self.system), self.keys))
+        return self._hash
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, Chord):
-            return self.keys == other.keys
+            if self.system is other.system:
+                return self.bits == other.bits
+            else:
+                return self.keys == other.keys
         else:
             return NotImplemented
 
@@ -1010,6 +1290,10 @@ def _is_chord_in_single_element_tuple(key: object) -> bool:
     )
 
 
+# Stands in for missing entries where `None` could be a value
+_missing = object()
+
+
 K = TypeVar("K")
 V = TypeVar("V")
 K2 = TypeVar("K2")
@@ -1019,6 +1303,8 @@ V3 = TypeVar("V3")
 
 
 class Dictionary(Generic[K, V]):
+    __slots__ = ("dict",)
+
     def __init__(
         self,
         iterable_or_dict: Union[Iterable[Tuple[K, V]], Dict[K, V]]
@@ -1028,9 +1314,14 @@ class Dictionary(Generic[K, V]):
         if isinstance(iterable_or_dict, dict):
             self.dict = iterable_or_dict
         else:
-            self.dict = {}
-            for k, v in iterable_or_dict:
-                if warn_overlapping_dict_entries:
+            items = list(iterable_or_dict)
+            self.dict = dict(items)
+
+            # Only go through the entries one by one if some key is present
+            # more than once, since that's very rarely the case
+            if warn_overlapping_dict_entries and len(self.dict) != len(items):
+                self.dict = {}
+                for k, v in items:
                     if k in self.dict and self.dict[k] != v:
                         warn(
                             f"The key {k!r} is present more than once while " +
@@ -1038,10 +1329,33 @@ class Dictionary(Generic[K, V]):
                             f"{self.dict[k]!r} and once with {v!r}."
                         )
 
-                self.dict[k] = v
+                    self.dict[k] = v
+
+    def union(
+        self,
+        *others: 'Dictionary[K, V]'
+    ) -> 'Dictionary[K, V]':
+        """
+        The same as adding all `others` to this dictionary, but without
+        building all of the dictionaries in between
+        """
+        dictionaries = (self,) + others
+        out: Dict[K, V] = {}
+        for i in dictionaries:
+            out.update(i.dict)
+
+        # Just like in `__init__`, the entries only have to be gone through one
+        # by one if some key is present more than once
+        if (
+            warn_overlapping_dict_entries and
+            len(out) != sum(len(i.dict) for i in dictionaries)
+        ):
+            return Dictionary(chain.from_iterable(dictionaries))
+        else:
+            return Dictionary(out)
 
     def copy(self) -> 'Dictionary[K, V]':
-        return Dictionary(self.dict.items())
+        return Dictionary(self.dict.copy())
 
     def keys(self) -> Iterable[K]:
         return self.dict.keys()
@@ -1128,12 +1442,26 @@ class Dictionary(Generic[K, V]):
     def map(
         self,
         *,
-        keys: Callable[[K], Any]=lambda x: x,
-        values: Callable[[V], Any]=lambda x: x
+        keys: Optional[Callable[[K], Any]]=None,
+        values: Optional[Callable[[V], Any]]=None
     ) -> 'Dictionary[K2, V2]':
-        typed_keys: Callable[[K], K2] = keys
-        typed_values: Callable[[V], V2] = values
-        return Dictionary((typed_keys(k), typed_values(v)) for k, v in self)
+        typed_keys: Callable[[K], K2] = unwrap_optional_or(keys, lambda x: x)
+        typed_values: Callable[[V], V2] = (
+            unwrap_optional_or(values, lambda x: x)
+        )
+
+        if keys is None and values is None:
+            return cast('Dictionary[K2, V2]', self.copy())
+        elif keys is None:
+            # The keys stay the same, so they can't end up overlapping and the
+            # new dictionary can be built in one go
+            mapped: Dict[Any, V2] = {
+                k: typed_values(v)
+                for k, v in self.dict.items()
+            }
+            return Dictionary(mapped)
+        else:
+            return Dictionary((typed_keys(k), typed_values(v)) for k, v in self)
 
     def to_multi_chords(
         self: 'Dictionary[Chord[SystemT], V]'
@@ -1192,19 +1520,57 @@ class Dictionary(Generic[K, V]):
     ) -> 'Dictionary[K3, V3]':
         typed_keys: Callable[[K, K2], K3] = keys
         typed_values: Callable[[V, V2], V3] = values
+
+        # `concat` on two strings is just `+`, this saves it from checking the
+        # types again for every single pair
+        all_values = chain(self.values(), other.values())
+        if values is concat and all(isinstance(i, str) for i in all_values):
+            typed_values = cast(Callable[[V, V2], V3], str.__add__)
+
+        if keys is Chord.combine:
+            return Dictionary(self._combine_chords(other, typed_values))
+
         return Dictionary(
             (typed_keys(kl, kr), typed_values(vl, vr))
-            for kl, vl in self
-            for kr, vr in other
+            for (kl, vl), (kr, vr) in product(self, other)
         )
 
+    def _combine_chords(
+        self,
+        other: 'Dictionary[K2, V2]',
+        values: Callable[[V, V2], V3],
+    ) -> Iterator[Tuple[Any, V3]]:
+        """
+        The same as `combinations` with `keys=Chord.combine`, but on the bits
+        of the chords directly (this is by far the most common combination)
+        """
+        right = [
+            (kr, kr.bits & ~kr.system.combining_bits, vr)
+            for kr, vr in cast('Dictionary[Chord[Any], V2]', other)
+        ]
+        for kl, vl in cast('Dictionary[Chord[Any], V]', self):
+            system = kl.system
+            kl_noncombining = kl.bits & ~system.combining_bits
+            for kr, kr_noncombining, vr in right:
+                if kr.system is not system or kl_noncombining & kr_noncombining:
+                    kl.combine(kr)  # Raises the appropriate error
+                yield (system.chord_of_bits(kl.bits | kr.bits), values(vl, vr))
+
     def to_plover_dict(
         self: Union[
             'Dictionary[Chord[SystemT], str]',
             'Dictionary[Tuple[Chord[SystemT], ...], str]'
         ]
     ) -> Dict[str, str]:
-        return {to_plover_str(k): v for k, v in self}
+        # Most keys are single chords, which don't need to be joined
+        return {
+            (
+                k.plover_str
+                if isinstance(k, Chord)
+                else "/".join([i.plover_str for i in k])
+            ): v
+            for k, v in self.dict.items()
+        }
 
     def print_as_plover_json_dict(
         self: Union[
@@ -1243,14 +1609,14 @@ class Dictionary(Generic[K, V]):
 
         try:
             return self[
-                tuple(
+                tuple([
                     system.parse(
                         i,
                         force_parse_mandatory_replacements=True,
                         include_always_pressed=False
                     )
                     for i in key
-                )
+                ])
             ]
         except ChordParseError:
             # This happens with *other* dictionaries that have overlays
@@ -1364,7 +1730,7 @@ class Dictionary(Generic[K, V]):
         suffix_or_prefix: Callable[[str], Callable[[str], str]]
     ) -> Any:
         if isinstance(other, Dictionary):
-            return Dictionary(chain(self, other))
+            return self.union(other)
         elif isinstance(other, Chord):
             self_chord_k = cast(Dictionary[Chord[Any], V], self)
             return self_chord_k.map(keys=add(other))
@@ -1418,10 +1784,21 @@ class Dictionary(Generic[K, V]):
     def __sub__(self, other: Iterable[K]) -> 'Dictionary[K, V]':
         if hasattr(other, "__iter__"):
             other = list(other)
+            removed = set(other)
             if warn_missing_keys_in_dict_sub:
-                if not all(k in self for k in other):
+                # Keys can also be present in their other form (see
+                # `__contains__`), but they usually aren't
+                all_present = (
+                    removed <= self.dict.keys() or
+                    all(k in self for k in other)
+                )
+                if not all_present:
                     warn(f"Not all keys of {other!r} are present in {self!r}")
-            return Dictionary((k, v) for k, v in self if k not in other)
+            return Dictionary({
+                k: v
+                for k, v in self.dict.items()
+                if k not in removed
+            })
         else:
             return NotImplemented
 
@@ -1449,10 +1826,10 @@ class Dictionary(Generic[K, V]):
     # Using `Any` because `mypy` doesn't like `Union`ing everything together as
     # of version 0.800
     def __contains__(self, key: Any) -> bool:
-        if isinstance(key, Chord) and (key,) in self.dict:
-            return True
-
-        if _is_chord_in_single_element_tuple(key) and key[0] in self.dict:
+        if isinstance(key, Chord):
+            if (key,) in self.dict:
+                return True
+        elif _is_chord_in_single_element_tuple(key) and key[0] in self.dict:
             return True
 
         return key in self.dict
@@ -1470,11 +1847,16 @@ class Dictionary(Generic[K, V]):
         key: Chord[SystemT]
     ) -> V: ...
     def __getitem__(self, key: Any) -> V:
-        if isinstance(key, Chord) and (key,) in self.dict:
-            return self.dict[cast(Any, (key,))]
-
-        if _is_chord_in_single_element_tuple(key) and key[0] in self.dict:
-            return self.dict[key[0]]
+        # This is what Plover looks every stroke up with, so the other form of
+        # the key is only looked up once instead of checking for it first
+        if isinstance(key, Chord):
+            value = self.dict.get(cast(Any, (key,)), _missing)
+            if value is not _missing:
+                return cast(V, value)
+        elif _is_chord_in_single_element_tuple(key):
+            value = self.dict.get(key[0], _missing)
+            if value is not _missing:
+                return cast(V, value)
 
         return self.dict[key]
 
@@ -1605,33 +1987,47 @@ single_digit_only = Dictionary(
     (digits[i], str(i))
     for i in range(10)
 )
-double_digit_only = Dictionary(
-    (digits[i] + digits[j], str(i) + str(j))
-    for i in range(10)
-    for j in range(10)
-    if i != j and system.keys_ordered(digit_keys[i], digit_keys[j])
-) + Dictionary(
-    (digits[i] + digits[j] + system.chord("E", "U"), str(i) + str(j))
-    for i in range(10)
-    for j in range(10)
-    if i != j and system.keys_ordered(digit_keys[j], digit_keys[i])
-) + Dictionary((digits[i] + "-D", str(i) * 2) for i in range(10))
+# Which digits can be stroked in which order, and what to add if they have to
+# be reversed instead
+_digits_ordered = [
+    [system.keys_ordered(i, j) for j in digit_keys]
+    for i in digit_keys
+]
+_reverse_digits = system.chord("E", "U")
+double_digit_only = Dictionary.union(
+    Dictionary(
+        (digits[i] + digits[j], str(i) + str(j))
+        for i, j in product(range(10), repeat=2)
+        if i != j and _digits_ordered[i][j]
+    ),
+    Dictionary(
+        (digits[i] + digits[j] + _reverse_digits, str(i) + str(j))
+        for i, j in product(range(10), repeat=2)
+        if i != j and _digits_ordered[j][i]
+    ),
+    Dictionary((digits[i] + "-D", str(i) * 2) for i in range(10)),
+)
 hundred00 = system.parsed_single_dict({"0D": "100"})
-double_digit_only_hundred00 = double_digit_only - hundred00.keys() + hundred00
+double_digit_only_hundred00 = Dictionary.union(
+    double_digit_only - hundred00.keys(),
+    hundred00,
+)
 hundred1z = system.parsed_single_dict({"1-Z": "100"})
-double_digit_only_hundred1z = double_digit_only + hundred1z
-single_and_double_digit = single_digit_only + double_digit_only
-single_and_double_digit_hundred00 = (
-    single_digit_only + double_digit_only_hundred00
+double_digit_only_hundred1z = Dictionary.union(double_digit_only, hundred1z)
+single_and_double_digit = Dictionary.union(single_digit_only, double_digit_only)
+single_and_double_digit_hundred00 = Dictionary.union(
+    single_digit_only,
+    double_digit_only_hundred00,
 )
-single_and_double_digit_hundred1z = (
-    single_digit_only + double_digit_only_hundred1z
+single_and_double_digit_hundred1z = Dictionary.union(
+    single_digit_only,
+    double_digit_only_hundred1z,
 )
 hundreds = Dictionary(
     (digits[i] + "-Z", str(i) + "00")
     for i in range(10)
 )
-numbers = single_and_double_digit + hundreds
+numbers = Dictionary.union(single_and_double_digit, hundreds)
 
 # Fingertyping
 fingertyping_lowercase_no_asterisk = system.parsed_single_dict({